@@ -2,6 +2,9 @@ import numpy as np
 import math
 import random
 import json
+import time
+import heapq
+import multiprocessing
 from matplotlib.colors import ListedColormap
 import matplotlib.pyplot as plt
 import matplotlib.animation as anim
@@ -19,10 +22,53 @@ SLICE_INFECTED_FRACTIONS_ERROR = "Sliced Infected Fractions Error"
 VACCINATED_INFECTED_FRACTIONS = "Vaccinated Infected Fraction"
 VACCINATED_INFECTED_FRACTIONS_ERROR = "Vaccinated Infected Fractions Error"
 
+SLICE_HYSTERESIS = "Sliced Hysteresis Gap"
+VACCINATED_HYSTERESIS = "Vaccinated Hysteresis Gap"
+
+SLICE_EQUILIBRATION_SWEEPS = "Sliced Equilibration Sweeps"
+VACCINATED_EQUILIBRATION_SWEEPS = "Vaccinated Equilibration Sweeps"
+
+STUDY_SIZES = "Lattice Sizes"
+STUDY_SLICED = "Sliced Variance By Size"
+STUDY_VACCINATED = "Vaccinated Fractions By Size"
+STUDY_PEAKS = "Peak Scaling Table"
+STUDY_THRESHOLDS = "Immunity Threshold Table"
+STUDY_COLLAPSE = "Data Collapse Table"
+STUDY_EXPONENTS = "Scaling Exponents"
+
 SAMPLES = 1000
 SLICED_SWEEPS = 10000
 EQUILIBRIUM_TIME = 100
 RESOLUTION = 25
+VACCINATED_LOOPS = 5
+
+SLICED_P_1 = np.linspace(0.2, 0.5, RESOLUTION)
+VACCINATED_FRACTIONS = np.linspace(0, 1, RESOLUTION)
+
+# Continuation (warm start) re-equilibration: after every block of sweeps
+# a straight line is fitted to the infected fraction of the last
+# CONTINUATION_WINDOW blocks. The lattice counts as equilibrated once the
+# drift along that line is within CONTINUATION_SIGMAS standard errors for
+# CONTINUATION_PASSES checks in a row, the standard error being corrected
+# with the autocorrelation time measured from the same window. It never
+# runs for more than EQUILIBRIUM_TIME sweeps.
+CONTINUATION_BLOCK = 10
+CONTINUATION_WINDOW = 5
+CONTINUATION_SIGMAS = 2
+CONTINUATION_PASSES = 2
+
+# Finite-size scaling study. Job costs are estimated from size^2 x sweeps
+# and the site updates per second measured by running the sliced scan on
+# a small calibration lattice.
+SIZES = [25, 50, 75, 100]
+CALIBRATION_SIZE = 20
+CALIBRATION_SWEEPS = 20
+# Conditions of the "Equilibrium" permanent immunity option
+STUDY_VACCINATION = (0.5, 0.5, 0.5)
+# Correlation length exponent of 2D directed percolation, used for the collapse
+STUDY_NU = 0.733
+# Infected fraction below which a vaccinated lattice counts as absorbed
+ABSORBED_FRACTION = 1e-4
 
 class State(IntEnum):
     # Remember to update all member variables
@@ -73,6 +119,15 @@ class SIRModel():
         self.json_data[VACCINATED_INFECTED_FRACTIONS] = []
         self.json_data[VACCINATED_INFECTED_FRACTIONS_ERROR] = []
 
+        self.json_data[SLICE_HYSTERESIS] = []
+        self.json_data[VACCINATED_HYSTERESIS] = []
+
+        self.json_data[SLICE_EQUILIBRATION_SWEEPS] = []
+        self.json_data[VACCINATED_EQUILIBRATION_SWEEPS] = []
+
+        self.continuation = False
+        self.hysteresis = False
+
     def Start(self):
         self.mode = SIRModel.ParseChoices("Data collection or visualization? [D/V]: ", ["D", "V"])
         #self.size = SIRModel.ParseInput("Enter size of the lattice: ", int)
@@ -169,6 +224,73 @@ class SIRModel():
         probability = (1 - definite_immunity) / 3
         self.grid = np.random.choice(a=[int(State.S), int(State.I), int(State.R), int(State.V)], size=(self.size, self.size), p=[probability, probability, probability, definite_immunity])
 
+    def CanWarmStart(self):
+        # A neighbouring lattice can only seed the next point if it has the
+        # right size and is still active; an absorbed lattice never recovers.
+        if getattr(self, "grid", None) is None or self.grid.shape != (self.size, self.size):
+            return False
+        return bool(np.any(self.grid == State.I))
+
+    def AdjustVaccinated(self, vaccinated_fraction):
+        # Adds or removes permanently immune sites so the seeded lattice
+        # matches the vaccinated fraction of the new parameter point.
+        target = int(round(vaccinated_fraction * self.size**2))
+        vaccinated = np.flatnonzero(self.grid == State.V)
+        if len(vaccinated) < target:
+            others = np.flatnonzero(self.grid != State.V)
+            chosen = np.random.choice(others, target - len(vaccinated), replace=False)
+            self.grid.flat[chosen] = State.V
+        elif len(vaccinated) > target:
+            chosen = np.random.choice(vaccinated, len(vaccinated) - target, replace=False)
+            self.grid.flat[chosen] = np.random.choice([int(State.S), int(State.I), int(State.R)], size=len(chosen))
+
+    def Reequilibrate(self):
+        # Short re-equilibration of a warm started lattice, returns the
+        # number of sweeps that were needed.
+        window = CONTINUATION_WINDOW * CONTINUATION_BLOCK
+        fractions = []
+        passes = 0
+        while len(fractions) < EQUILIBRIUM_TIME:
+            for _ in range(CONTINUATION_BLOCK):
+                self.UpdateInfections()
+                if self.infected == 0:
+                    return len(fractions) + 1
+                fractions.append(self.infected / self.size**2)
+            if len(fractions) < window:
+                continue
+            drift, error = SIRModel.Drift(np.asarray(fractions[-window:]))
+            passes = passes + 1 if abs(drift) <= CONTINUATION_SIGMAS * error else 0
+            if passes == CONTINUATION_PASSES:
+                break
+        return len(fractions)
+
+    @staticmethod
+    def Drift(series):
+        # Change of the series over its length along a least squares line,
+        # and the standard error of that change for correlated samples.
+        t = np.arange(len(series))
+        slope, intercept = np.polyfit(t, series, 1)
+        residuals = series - (slope * t + intercept)
+        tau = SIRModel.AutocorrelationTime(residuals)
+        slope_error = np.std(residuals) * math.sqrt(2 * tau / np.sum((t - np.average(t))**2))
+        return slope * len(series), slope_error * len(series)
+
+    @staticmethod
+    def AutocorrelationTime(series):
+        # Integrated autocorrelation time, summed up to the first lag
+        # where the autocorrelation is no longer positive.
+        centred = series - np.average(series)
+        variance = np.average(centred**2)
+        tau = 0.5
+        if variance == 0:
+            return tau
+        for lag in range(1, len(series) // 2):
+            correlation = np.average(centred[:-lag] * centred[lag:]) / variance
+            if correlation <= 0:
+                break
+            tau += correlation
+        return tau
+
     def SetConditions(self, size, p_1, p_2, p_3):
         self.size = size
         self.p_infection = p_1
@@ -203,8 +325,11 @@ class SIRModel():
 
     def DataInit(self):
         # TODO: Add data specific variables here
-        collection_choice = SIRModel.ParseChoices("Fraction of Infected & Sliced, or Permanent Immunity? [F/P]: ", ["F", "P"])
+        collection_choice = SIRModel.ParseChoices("Fraction of Infected & Sliced, Permanent Immunity, or Size Study? [F/P/S]: ", ["F", "P", "S"])
         self.size = 50
+        self.continuation = SIRModel.ParseChoices("Random starts or Continuation? [R/C]: ", ["R", "C"]) == "C"
+        if self.continuation:
+            self.hysteresis = SIRModel.ParseChoices("Forward and backward passes for hysteresis? [Y/N]: ", ["Y", "N"]) == "Y"
         if collection_choice == "F":
             self.DataUpdate()
         elif collection_choice == "P":
@@ -214,55 +339,228 @@ class SIRModel():
                 self.VaccinatedData(0.8, 0.1, 0.02)
             elif start_state == "E":
                 self.VaccinatedData(0.5, 0.5, 0.5)
+        elif collection_choice == "S":
+            workers = SIRModel.ParseInput("Number of workers: ", int)
+            self.SizeStudy(SIZES, workers)
 
 
     def DataUpdate(self):
         print(np.linspace(0,1,RESOLUTION))
 
-        # Slice of p_2 = 0.5 p_3 = 0.5 and 0.2 <= p_1 <= 0.5
-        for p_1 in np.linspace(0.2, 0.5, RESOLUTION):
-            self.average_array = []
-            self.variance_array = []
-            self.DataSlice(SLICED_SWEEPS, p_1, 0.5, 0.5)
-            self.json_data[SLICE_INFECTED_FRACTIONS].append(self.average_array[0])
-            self.json_data[SLICE_INFECTED_FRACTIONS_VARIANCE].append(self.variance_array[0])
-            self.json_data[SLICE_INFECTED_FRACTIONS_ERROR].append(self.BootStrap(self.total_infected))
-            #print(p_1)
+        self.SlicedScan()
         self.SaveData("sliced_data.jsonc")
         self.PlotSlicedData("sliced_data.jsonc")
 
         # Slice of p_2 = 0.5 and 0 <= p_1,p_3 <= 1
         for p_1 in np.linspace(0,1,RESOLUTION):
-            self.average_array = []
-            self.variance_array = []
-            for p_3 in np.linspace(0,1,RESOLUTION):
-                self.DataSlice(SAMPLES, p_1, 0.5, p_3)
-            self.json_data[INFECTED_FRACTIONS].append(self.average_array)
-            self.json_data[INFECTED_FRACTIONS_VARIANCE].append(self.variance_array)
+            # Continuation runs along the p_3 axis of each row
+            points = [(p_1, 0.5, p_3, 0) for p_3 in np.linspace(0,1,RESOLUTION)]
+            averages, variances, _ = self.ScanPoints(SAMPLES, points, warm_start=self.continuation)
+            self.json_data[INFECTED_FRACTIONS].append(averages)
+            self.json_data[INFECTED_FRACTIONS_VARIANCE].append(variances)
             #print(p_1)
         self.SaveData("phase_data.jsonc")
         self.PlotData("phase_data.jsonc")
 
     def VaccinatedData(self, p_1, p_2, p_3):
-        for i in np.linspace(0, 1, RESOLUTION):
-            print("p_1", i)
-            values = []
-            #standard_error_mean = []
-            for j in range(5):
-                print("Loop", j)
-                self.average_array = []
-                self.variance_array = []
-                self.DataSlice(SAMPLES, p_1, p_2, p_3, vaccinated_fraction=i)
-                values.append(self.average_array[0])
-            
-            std = np.std(np.asarray(values))
-            #standard_error_mean.append( std / math.sqrt(5) )
-            self.json_data[VACCINATED_INFECTED_FRACTIONS].append(self.average_array[0])
-            self.json_data[VACCINATED_INFECTED_FRACTIONS_ERROR].append(std / math.sqrt(5))
-            print(i)
+        self.VaccinatedScan(p_1, p_2, p_3)
         self.SaveData("vaccinated_data.jsonc")
         self.PlotVaccinatedData("vaccinated_data.jsonc")
-            
+
+    @staticmethod
+    def SlicedPoints():
+        # Slice of p_2 = 0.5 p_3 = 0.5 and 0.2 <= p_1 <= 0.5
+        return [(p_1, 0.5, 0.5, 0) for p_1 in SLICED_P_1]
+
+    @staticmethod
+    def VaccinatedPoints(p_1, p_2, p_3):
+        return [(p_1, p_2, p_3, fraction) for fraction in VACCINATED_FRACTIONS]
+
+    def SlicedScan(self):
+        points = SIRModel.SlicedPoints()
+        averages, variances, histories = self.ScanPoints(SLICED_SWEEPS, points, warm_start=self.continuation)
+        self.json_data[SLICE_EQUILIBRATION_SWEEPS] = self.equilibration_array
+        self.json_data[SLICE_INFECTED_FRACTIONS] = averages
+        self.json_data[SLICE_INFECTED_FRACTIONS_VARIANCE] = variances
+        self.json_data[SLICE_INFECTED_FRACTIONS_ERROR] = [self.BootStrap(history) for history in histories]
+        if self.hysteresis:
+            self.json_data[SLICE_HYSTERESIS] = self.HysteresisGap(SLICED_SWEEPS, points, averages)
+
+    def VaccinatedScan(self, p_1, p_2, p_3):
+        points = SIRModel.VaccinatedPoints(p_1, p_2, p_3)
+        runs = []
+        gaps = []
+        equilibration = []
+        # Each loop is an independent chain along the vaccinated fraction axis
+        for j in range(VACCINATED_LOOPS):
+            print("Loop", j)
+            averages, _, _ = self.ScanPoints(SAMPLES, points, warm_start=self.continuation)
+            runs.append(averages)
+            equilibration.append(self.equilibration_array)
+            if self.hysteresis:
+                gaps.append(self.HysteresisGap(SAMPLES, points, averages))
+
+        runs = np.asarray(runs)
+        std = np.std(runs, axis=0)
+        self.json_data[VACCINATED_INFECTED_FRACTIONS] = list(runs[-1])
+        self.json_data[VACCINATED_INFECTED_FRACTIONS_ERROR] = list(std / math.sqrt(VACCINATED_LOOPS))
+        self.json_data[VACCINATED_EQUILIBRATION_SWEEPS] = list(np.average(equilibration, axis=0))
+        if self.hysteresis:
+            self.json_data[VACCINATED_HYSTERESIS] = list(np.average(gaps, axis=0))
+        return runs
+
+    def SizeStudy(self, sizes, workers):
+        # Runs the sliced variance and vaccination scans for every lattice
+        # size on a pool of workers, longest estimated jobs first.
+        cores = multiprocessing.cpu_count()
+        if workers > cores:
+            print("Only", cores, "cores available, using", cores, "workers")
+            workers = cores
+
+        throughput = self.CalibrateThroughput()
+        jobs = []
+        for size in sizes:
+            for kind in ["sliced", "vaccinated"]:
+                job = (kind, size, self.continuation, self.hysteresis)
+                jobs.append((SIRModel.EstimateCost(job) / throughput, job))
+        jobs.sort(key=lambda cost_job: cost_job[0], reverse=True)
+
+        for cost, job in jobs:
+            print("Job", job[0], "L =", job[1], "estimated", round(cost), "s")
+        print("Predicted wall-clock time (upper bound):", round(SIRModel.PredictMakespan([cost for cost, _ in jobs], workers)), "s")
+
+        start = time.time()
+        results = {}
+        with multiprocessing.Pool(workers) as pool:
+            # Tasks are handed out in submission order, so sorting the jobs
+            # by cost makes the pool a longest processing time first schedule
+            for kind, size, data in pool.imap_unordered(SIRModel.RunStudyJob, [job for _, job in jobs], chunksize=1):
+                print("Finished", kind, "L =", size, "after", round(time.time() - start), "s")
+                results[(kind, size)] = data
+        print("Actual wall-clock time:", round(time.time() - start), "s")
+
+        self.json_data = self.ScalingTables(sizes, results)
+        self.SaveData("size_study_data.jsonc")
+        self.PlotSizeStudy("size_study_data.jsonc")
+
+    def CalibrateThroughput(self):
+        # Site updates per second of the sliced scan on a small lattice
+        self.size = CALIBRATION_SIZE
+        start = time.time()
+        self.ScanPoints(CALIBRATION_SWEEPS, SIRModel.SlicedPoints(), warm_start=self.continuation)
+        throughput = sum(self.sweeps_array) * CALIBRATION_SIZE**2 / (time.time() - start)
+        print("Calibrated throughput:", round(throughput), "site updates per second")
+        return throughput
+
+    @staticmethod
+    def EstimateCost(job):
+        # Upper bound on the site updates of a job. Every point is charged
+        # its full equilibration and measurement: whether a point absorbs
+        # early depends on the lattice size, so it can not be calibrated on
+        # a small lattice.
+        kind, size, _, hysteresis = job
+        if kind == "sliced":
+            sweeps = len(SLICED_P_1) * (SLICED_SWEEPS + EQUILIBRIUM_TIME)
+        else:
+            sweeps = VACCINATED_LOOPS * len(VACCINATED_FRACTIONS) * (SAMPLES + EQUILIBRIUM_TIME)
+        if hysteresis:
+            sweeps *= 2
+        return size**2 * sweeps
+
+    @staticmethod
+    def PredictMakespan(costs, workers):
+        # Replays the greedy schedule: each job goes to the first free worker
+        finish_times = [0.0] * workers
+        for cost in costs:
+            heapq.heapreplace(finish_times, finish_times[0] + cost)
+        return max(finish_times)
+
+    @staticmethod
+    def RunStudyJob(job):
+        kind, size, continuation, hysteresis = job
+        model = SIRModel()
+        model.size = size
+        model.continuation = continuation
+        model.hysteresis = hysteresis
+        if kind == "sliced":
+            model.SlicedScan()
+            data = model.json_data[SLICE_INFECTED_FRACTIONS_VARIANCE]
+        else:
+            data = list(np.average(model.VaccinatedScan(*STUDY_VACCINATION), axis=0))
+        return kind, size, data
+
+    @staticmethod
+    def ScalingTables(sizes, results):
+        peaks = []
+        thresholds = []
+        for size in sizes:
+            variance = np.asarray(results[("sliced", size)])
+            peak = int(np.argmax(variance))
+            peaks.append([size, SLICED_P_1[peak], variance[peak]])
+
+            infected = np.asarray(results[("vaccinated", size)])
+            absorbed = np.flatnonzero(infected < ABSORBED_FRACTION)
+            thresholds.append([size, VACCINATED_FRACTIONS[absorbed[0]] if len(absorbed) else None])
+
+        # Peak variance ~ L^(gamma/nu) and p_peak(L) = p_c + a L^(-1/nu)
+        exponents = {"nu": STUDY_NU, "gamma/nu": None, "p_c": None}
+        fitted = [(size, p_peak, chi) for size, p_peak, chi in peaks if chi > 0]
+        if len(fitted) >= 2:
+            sizes_fit, p_peaks, chis = (np.asarray(column, dtype=float) for column in zip(*fitted))
+            exponents["gamma/nu"] = np.polyfit(np.log(sizes_fit), np.log(chis), 1)[0]
+            exponents["p_c"] = np.polyfit(sizes_fit**(-1 / STUDY_NU), p_peaks, 1)[1]
+
+        collapse = []
+        if exponents["p_c"] is not None:
+            for size in sizes:
+                variance = np.asarray(results[("sliced", size)])
+                x = (SLICED_P_1 - exponents["p_c"]) * size**(1 / STUDY_NU)
+                y = variance * size**(-exponents["gamma/nu"])
+                collapse.append([size, list(x), list(y)])
+
+        print("L, p_1 at peak, peak variance")
+        for row in peaks:
+            print(*row, sep=", ")
+        print("L, minimal immune fraction")
+        for row in thresholds:
+            print(*row, sep=", ")
+        print("Exponents:", exponents)
+
+        return {
+            STUDY_SIZES: list(sizes),
+            STUDY_SLICED: [results[("sliced", size)] for size in sizes],
+            STUDY_VACCINATED: [results[("vaccinated", size)] for size in sizes],
+            STUDY_PEAKS: peaks,
+            STUDY_THRESHOLDS: thresholds,
+            STUDY_COLLAPSE: collapse,
+            STUDY_EXPONENTS: exponents,
+        }
+
+    def ScanPoints(self, sweeps, points, warm_start = False, seeded = False):
+        # Runs DataSlice over (p_1, p_2, p_3, vaccinated_fraction) points in order.
+        # With warm_start every point is seeded from the final lattice of the
+        # previous one, seeded also warm starts the first point from self.grid.
+        self.average_array = []
+        self.variance_array = []
+        self.equilibration_array = []
+        self.sweeps_array = []
+        histories = []
+        for n, (p_1, p_2, p_3, vaccinated_fraction) in enumerate(points):
+            self.DataSlice(sweeps, p_1, p_2, p_3, vaccinated_fraction=vaccinated_fraction, warm_start=warm_start and (seeded or n > 0))
+            histories.append(self.total_infected)
+        if warm_start:
+            print("Equilibration sweeps:", sum(self.equilibration_array), "of", len(points) * EQUILIBRIUM_TIME, "for random starts")
+        return self.average_array, self.variance_array, histories
+
+    def HysteresisGap(self, sweeps, points, forward_averages):
+        # Backward pass continuing from the end of the forward pass, the gap
+        # between both branches is non zero where the steady state depends
+        # on the direction of approach.
+        backward_averages, _, _ = self.ScanPoints(sweeps, points[::-1], warm_start=True, seeded=True)
+        backward_averages = backward_averages[::-1]
+        gaps = list(np.abs(np.asarray(forward_averages) - np.asarray(backward_averages)))
+        print("Largest hysteresis gap:", max(gaps), "at", points[int(np.argmax(gaps))])
+        return gaps
 
     def UpdateInfections(self):
         self.infected = 0
@@ -308,23 +606,38 @@ class SIRModel():
         else:
             return False
 
-    def DataSlice(self, sweeps, p_1, p_2, p_3, vaccinated_fraction = 0):
+    def DataSlice(self, sweeps, p_1, p_2, p_3, vaccinated_fraction = 0, warm_start = False):
         sum = 0
         squared_sum = 0
         # Array to store the number affected over all sweeps
         self.total_infected = []
         self.SetConditions(self.size, p_1, p_2, p_3)
-        self.InitRandomGrid(definite_immunity = vaccinated_fraction)
-        for i in range(sweeps + EQUILIBRIUM_TIME):
+        seeded = warm_start and self.CanWarmStart()
+        if seeded:
+            # Seeds from the lattice of the neighbouring point, vaccinating
+            # sites can remove the last infected ones so check again after
+            self.AdjustVaccinated(vaccinated_fraction)
+            seeded = bool(np.any(self.grid == State.I))
+        if seeded:
+            self.equilibration_array.append(self.Reequilibrate())
+            equilibrium_time = 0
+        else:
+            self.InitRandomGrid(definite_immunity = vaccinated_fraction)
+            self.equilibration_array.append(EQUILIBRIUM_TIME)
+            equilibrium_time = EQUILIBRIUM_TIME
+        executed = self.equilibration_array[-1] if seeded else 0
+        for i in range(sweeps + equilibrium_time):
             # Runs the update loop that was set before the for loop
             self.UpdateInfections()
+            executed += 1
             if self.infected == 0:
                 break
             # Waits for equilibrium and samples with autocorrection time of 10
-            if i >= EQUILIBRIUM_TIME:
+            if i >= equilibrium_time:
                 self.total_infected.append(self.infected)
                 sum += self.infected
                 squared_sum += self.infected**2
+        self.sweeps_array.append(executed)
         average = sum / sweeps
         squared_average = squared_sum / sweeps
         self.average_array.append(average / (self.size**2))
@@ -354,7 +667,7 @@ class SIRModel():
             sliced_variance = j.get(SLICE_INFECTED_FRACTIONS_VARIANCE)
 
             #plt.scatter(np.linspace(0.2, 0.5, RESOLUTION), sliced_variance)
-            plt.errorbar(np.linspace(0.2, 0.5, RESOLUTION), sliced_variance, yerr=j.get(SLICE_INFECTED_FRACTIONS_ERROR), capsize = 5, fmt='none')
+            plt.errorbar(SLICED_P_1, sliced_variance, yerr=j.get(SLICE_INFECTED_FRACTIONS_ERROR), capsize = 5, fmt='none')
             plt.title("Variance of Infected Sites")
             plt.xlabel("Probability of Infection (p_1)")
             plt.ylabel("Variance")
@@ -370,8 +683,8 @@ class SIRModel():
             v_infected_fractions = j.get(VACCINATED_INFECTED_FRACTIONS)
             fractions_error = j.get(VACCINATED_INFECTED_FRACTIONS_ERROR)
 
-            plt.scatter(np.linspace(0, 1, RESOLUTION), v_infected_fractions, marker=".")
-            plt.errorbar(np.linspace(0, 1, RESOLUTION), v_infected_fractions, yerr=fractions_error, capsize = 5, fmt='none')
+            plt.scatter(VACCINATED_FRACTIONS, v_infected_fractions, marker=".")
+            plt.errorbar(VACCINATED_FRACTIONS, v_infected_fractions, yerr=fractions_error, capsize = 5, fmt='none')
             plt.title("Minimal Immune Fraction")
             plt.xlabel("Fraction of Immunity")
             plt.ylabel("Average Infected Fraction")
@@ -381,6 +694,26 @@ class SIRModel():
             # Call plot function(s)
             print("Finished plotting data!")
 
+    def PlotSizeStudy(self, filepath):
+        with open(filepath) as json_file:
+            j = json.load(json_file)
+            peaks = np.asarray(j.get(STUDY_PEAKS), dtype=float)
+
+            plt.loglog(peaks[:, 0], peaks[:, 2], marker="o")
+            plt.title("Peak Variance Scaling")
+            plt.xlabel("Lattice Size (L)")
+            plt.ylabel("Peak Variance")
+            plt.show()
+
+            for size, x, y in j.get(STUDY_COLLAPSE):
+                plt.scatter(x, y, marker=".", label="L = " + str(size))
+            plt.title("Data Collapse")
+            plt.xlabel("(p_1 - p_c) L^(1/nu)")
+            plt.ylabel("Variance L^(-gamma/nu)")
+            plt.legend()
+            plt.show()
+            print("Finished plotting data!")
+
     def PlotData(self, filepath):
         with open(filepath) as json_file:
             j = json.load(json_file)
@@ -407,9 +740,10 @@ class SIRModel():
 
 
 
-sim = SIRModel()
-sim.json_path = "data.jsonc"
+if __name__ == "__main__":
+    sim = SIRModel()
+    sim.json_path = "data.jsonc"
 
-sim.Start()
+    sim.Start()
 
 #sim.PlotSlicedData("sliced_data.jsonc")
\ No newline at end of file